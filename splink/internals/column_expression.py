@@ -47,6 +47,9 @@ class ColumnExpression:
     def __init__(self, sql_expression: str, sql_dialect: SplinkDialect = None):
         self.raw_sql_expression = sql_expression
         self.operations: list[ColumnExpressionOperation] = []
+        # parsed raw expression per sqlglot dialect. It depends only on
+        # raw_sql_expression, so clones can safely share it
+        self._parsed_input_strings: dict[str, str] = {}
         if sql_dialect is not None:
             self.sql_dialect: SplinkDialect = sql_dialect
 
@@ -79,12 +82,19 @@ class ColumnExpression:
         that the user will specify in their linker.
         """
 
-        if not self.raw_sql_is_pure_column_or_column_reference:
-            return self.raw_sql_expression
+        sqlglot_dialect = sql_dialect.sqlglot_dialect
+        parsed = self._parsed_input_strings.get(sqlglot_dialect)
+        if parsed is not None:
+            return parsed
 
-        return SqlglotColumnTreeBuilder.from_raw_column_name_or_column_reference(
-            self.raw_sql_expression, sql_dialect.sqlglot_dialect
-        ).sql
+        if not self.raw_sql_is_pure_column_or_column_reference:
+            parsed = self.raw_sql_expression
+        else:
+            parsed = SqlglotColumnTreeBuilder.from_raw_column_name_or_column_reference(
+                self.raw_sql_expression, sqlglot_dialect
+            ).sql
+        self._parsed_input_strings[sqlglot_dialect] = parsed
+        return parsed
 
     @property
     def raw_sql_is_pure_column_or_column_reference(self) -> bool:
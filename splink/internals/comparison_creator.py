@@ -10,12 +10,17 @@ from .comparison import Comparison
 from .comparison_level_creator import (
     ComparisonLevelCreator,
     UnsuppliedNoneOr,
+    _UnsuppliedOption,
     unsupplied_option,
 )
 
 
 class ComparisonCreator(ABC):
     DEFAULT_COL_EXP_KEY = "__default__"
+    # levels and level dicts are only cached when this class builds the level
+    # creators itself. If they are supplied by the user they can be
+    # reconfigured at any time, so must be rendered afresh on every call
+    _cache_levels: bool = True
 
     def __init__(
         self,
@@ -31,20 +36,25 @@ class ComparisonCreator(ABC):
         """
         # if it's not a dict, assume it is a single expression-like
         if not isinstance(col_name_or_names, dict):
-            cols = {self.DEFAULT_COL_EXP_KEY: col_name_or_names}
+            col_expression = ColumnExpression.instantiate_if_str(col_name_or_names)
+            self.col_expressions = {self.DEFAULT_COL_EXP_KEY: col_expression}
+            self._col_expression = col_expression
         else:
-            cols = col_name_or_names
-
-        self.col_expressions = {
-            name_reference: ColumnExpression.instantiate_if_str(column)
-            for name_reference, column in cols.items()
-        }
+            self.col_expressions = {
+                name_reference: ColumnExpression.instantiate_if_str(column)
+                for name_reference, column in col_name_or_names.items()
+            }
         self._validate()
 
     # many ComparisonCreators have a single column expression, so provide a
     # convenience property for this case. Error if there are none or many
     @property
     def col_expression(self) -> ColumnExpression:
+        # set on construction when we are given a single column
+        col_expression = getattr(self, "_col_expression", None)
+        if col_expression is not None:
+            return col_expression
+
         num_cols = len(self.col_expressions)
         if num_cols > 1:
             raise SplinkException(
@@ -67,16 +77,36 @@ class ComparisonCreator(ABC):
 
     def _validate(self) -> None:
         # create levels - let them raise errors if there are issues
-        self.create_comparison_levels()
+        self._get_levels()
 
     @abstractmethod
     def create_comparison_levels(self) -> List[ComparisonLevelCreator]:
         pass
 
+    @final
+    def _get_levels(self) -> List[ComparisonLevelCreator]:
+        # create_comparison_levels() builds every level from scratch, so hold on
+        # to the result. The cache is reset whenever the comparison is configured,
+        # or its term frequency adjustments are changed
+        if not self._cache_levels:
+            return self.create_comparison_levels()
+
+        cached_levels = getattr(self, "_cached_levels", None)
+        if cached_levels is None:
+            cached_levels = self.create_comparison_levels()
+            self._cached_levels: Optional[List[ComparisonLevelCreator]] = cached_levels
+        return cached_levels
+
+    @final
+    def _clear_caches(self) -> None:
+        # levels may have been furnished with previous options, so start afresh
+        self._cached_levels = None
+        self._comparison_cache: Dict[str, dict[str, Any]] = {}
+
     @final
     def get_configured_comparison_levels(self) -> List[ComparisonLevelCreator]:
         # furnish comparison levels with m and u probabilities as needed
-        comparison_levels = self.create_comparison_levels()
+        comparison_levels = self._get_levels()
 
         if self.term_frequency_adjustments:
             for cl in comparison_levels:
@@ -87,35 +117,33 @@ class ComparisonCreator(ABC):
                 ):
                     cl.term_frequency_adjustments = True
 
-        if self.m_probabilities:
-            m_values = self.m_probabilities.copy()
-            comparison_levels = [
-                cl.configure(
-                    m_probability=m_values.pop(0) if not cl.is_null_level else None,
-                )
-                for cl in comparison_levels
-            ]
-        if self.u_probabilities:
-            u_values = self.u_probabilities.copy()
-            comparison_levels = [
-                cl.configure(
-                    u_probability=u_values.pop(0) if not cl.is_null_level else None,
-                )
-                for cl in comparison_levels
-            ]
+        m_values = iter(self.m_probabilities) if self.m_probabilities else None
+        u_values = iter(self.u_probabilities) if self.u_probabilities else None
+        if m_values is not None or u_values is not None:
+            # a single pass, so that each level is configured only once
+            null_level_mask = [cl.is_null_level for cl in comparison_levels]
+            for cl, is_null_level in zip(comparison_levels, null_level_mask):
+                probabilities: Dict[str, Any] = {}
+                if m_values is not None:
+                    probabilities["m_probability"] = (
+                        None if is_null_level else next(m_values)
+                    )
+                if u_values is not None:
+                    probabilities["u_probability"] = (
+                        None if is_null_level else next(u_values)
+                    )
+                cl.configure(**probabilities)
         return comparison_levels
 
     @final
     @property
     def num_levels(self) -> int:
-        return len(self.create_comparison_levels())
+        return len(self._get_levels())
 
     @final
     @property
     def num_non_null_levels(self) -> int:
-        return len(
-            [cl for cl in self.create_comparison_levels() if not cl.is_null_level]
-        )
+        return sum(1 for cl in self._get_levels() if not cl.is_null_level)
 
     def create_description(self) -> str:
         return self.__class__.__name__
@@ -136,7 +164,32 @@ class ComparisonCreator(ABC):
 
     @final
     def create_comparison_dict(self, sql_dialect_str: str) -> dict[str, Any]:
-        level_dict = {
+        if not self._cache_levels:
+            return self._render_comparison_dict(sql_dialect_str)
+
+        # rendering the sql of every level is relatively costly, so keep the result
+        # for each dialect. The cache is reset along with the cached levels
+        comparison_cache = getattr(self, "_comparison_cache", None)
+        if comparison_cache is None:
+            comparison_cache = {}
+            self._comparison_cache = comparison_cache
+
+        level_dict = comparison_cache.get(sql_dialect_str)
+        if level_dict is None:
+            level_dict = self._render_comparison_dict(sql_dialect_str)
+            comparison_cache[sql_dialect_str] = level_dict
+
+        # hand out a copy so that callers can't modify what we have cached
+        return {
+            **level_dict,
+            "comparison_levels": [
+                dict(cl_dict) for cl_dict in level_dict["comparison_levels"]
+            ],
+        }
+
+    @final
+    def _render_comparison_dict(self, sql_dialect_str: str) -> dict[str, Any]:
+        return {
             "comparison_description": self.create_description(),
             "output_column_name": self.create_output_column_name(),
             "comparison_levels": [
@@ -144,7 +197,6 @@ class ComparisonCreator(ABC):
                 for cl in self.get_configured_comparison_levels()
             ],
         }
-        return level_dict
 
     @final
     def configure(
@@ -194,15 +246,31 @@ class ComparisonCreator(ABC):
             ```
 
         """
-        configurables = {
-            "term_frequency_adjustments": term_frequency_adjustments,
-            "m_probabilities": m_probabilities,
-            "u_probabilities": u_probabilities,
-        }
+        options_to_set: Dict[str, Any] = {}
+        if term_frequency_adjustments is not unsupplied_option:
+            options_to_set["term_frequency_adjustments"] = term_frequency_adjustments
+
+        # check probabilities before changing anything, so that a bad call to
+        # .configure() leaves the comparison as it was
+        for m_or_u, probabilities in (("m", m_probabilities), ("u", u_probabilities)):
+            # None (or an empty list) leaves any previously set values in place
+            if isinstance(probabilities, _UnsuppliedOption) or not probabilities:
+                continue
+            num_probs_supplied = len(probabilities)
+            num_non_null_levels = self.num_non_null_levels
+            if num_probs_supplied != num_non_null_levels:
+                raise ValueError(
+                    f"Comparison has {num_non_null_levels} non-null levels, "
+                    f"but received {num_probs_supplied} values for "
+                    f"{m_or_u}_probabilities. These numbers must be the same."
+                )
+            # store as a tuple so later changes to the caller's list can't leak in
+            options_to_set[f"_{m_or_u}_probabilities"] = tuple(probabilities)
+
+        self._clear_caches()
 
-        for attribute_name, attribute_value in configurables.items():
-            if attribute_value is not unsupplied_option:
-                setattr(self, attribute_name, attribute_value)
+        for attribute_name, attribute_value in options_to_set.items():
+            setattr(self, attribute_name, attribute_value)
 
         return self
 
@@ -213,44 +281,17 @@ class ComparisonCreator(ABC):
     @term_frequency_adjustments.setter
     @final
     def term_frequency_adjustments(self, term_frequency_adjustments: bool) -> None:
+        self._clear_caches()
         self._term_frequency_adjustments = term_frequency_adjustments
 
     @property
     def m_probabilities(self):
         return getattr(self, "_m_probabilities", None)
 
-    @m_probabilities.setter
-    @final
-    def m_probabilities(self, m_probabilities: List[float]) -> None:
-        if m_probabilities:
-            num_probs_supplied = len(m_probabilities)
-            num_non_null_levels = self.num_non_null_levels
-            if num_probs_supplied != self.num_non_null_levels:
-                raise ValueError(
-                    f"Comparison has {num_non_null_levels} non-null levels, "
-                    f"but received {num_probs_supplied} values for m_probabilities. "
-                    "These numbers must be the same."
-                )
-            self._m_probabilities = m_probabilities
-
     @property
     def u_probabilities(self):
         return getattr(self, "_u_probabilities", None)
 
-    @u_probabilities.setter
-    @final
-    def u_probabilities(self, u_probabilities: List[float]) -> None:
-        if u_probabilities:
-            num_probs_supplied = len(u_probabilities)
-            num_non_null_levels = self.num_non_null_levels
-            if num_probs_supplied != self.num_non_null_levels:
-                raise ValueError(
-                    f"Comparison has {num_non_null_levels} non-null levels, "
-                    f"but received {num_probs_supplied} values for u_probabilities. "
-                    "These numbers must be the same."
-                )
-            self._u_probabilities = u_probabilities
-
     def __repr__(self) -> str:
         return (
             f"Comparison generator for {self.create_description()}. "
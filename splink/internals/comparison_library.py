@@ -43,7 +43,7 @@ class LevenshteinAtThresholds(ComparisonCreator):
     def __init__(
         self,
         col_name: str,
-        distance_threshold_or_thresholds: Union[Iterable[int], int] = [1, 2],
+        distance_threshold_or_thresholds: Union[Iterable[int], int] = (1, 2),
     ):
         """
         Represents a comparison of the data in `col_name` with three or more levels:
@@ -62,9 +62,9 @@ class LevenshteinAtThresholds(ComparisonCreator):
 
         Args:
             col_name (str): The name of the column to compare
-            distance_threshold_or_thresholds (Union[int, list], optional): The
+            distance_threshold_or_thresholds (Union[int, Iterable[int]], optional): The
                 threshold(s) to use for the levenshtein similarity level(s).
-                Defaults to [1, 2].
+                Defaults to (1, 2).
         """
 
         thresholds_as_iterable = ensure_is_iterable(distance_threshold_or_thresholds)
@@ -91,7 +91,7 @@ class DamerauLevenshteinAtThresholds(ComparisonCreator):
     def __init__(
         self,
         col_name: str,
-        distance_threshold_or_thresholds: Union[Iterable[int], int] = [1, 2],
+        distance_threshold_or_thresholds: Union[Iterable[int], int] = (1, 2),
     ):
         """
         Represents a comparison of the data in `col_name` with three or more levels:
@@ -110,9 +110,9 @@ class DamerauLevenshteinAtThresholds(ComparisonCreator):
 
         Args:
             col_name (str): The name of the column to compare.
-            distance_threshold_or_thresholds (Union[int, list], optional): The
+            distance_threshold_or_thresholds (Union[int, Iterable[int]], optional): The
                 threshold(s) to use for the Damerau-Levenshtein similarity level(s).
-                Defaults to [1, 2].
+                Defaults to (1, 2).
         """
 
         thresholds_as_iterable = ensure_is_iterable(distance_threshold_or_thresholds)
@@ -147,7 +147,7 @@ class JaccardAtThresholds(ComparisonCreator):
     def __init__(
         self,
         col_name: str,
-        score_threshold_or_thresholds: Union[Iterable[float], float] = [0.9, 0.7],
+        score_threshold_or_thresholds: Union[Iterable[float], float] = (0.9, 0.7),
     ):
         """
         Represents a comparison of the data in `col_name` with three or more levels:
@@ -166,9 +166,9 @@ class JaccardAtThresholds(ComparisonCreator):
 
         Args:
             col_name (str): The name of the column to compare.
-            score_threshold_or_thresholds (Union[float, list], optional): The
+            score_threshold_or_thresholds (Union[float, Iterable[float]], optional): The
                 threshold(s) to use for the Jaccard similarity level(s).
-                Defaults to [0.9, 0.7].
+                Defaults to (0.9, 0.7).
         """
 
         thresholds_as_iterable = ensure_is_iterable(score_threshold_or_thresholds)
@@ -194,7 +194,7 @@ class JaroAtThresholds(ComparisonCreator):
     def __init__(
         self,
         col_name: str,
-        score_threshold_or_thresholds: Union[Iterable[float], float] = [0.9, 0.7],
+        score_threshold_or_thresholds: Union[Iterable[float], float] = (0.9, 0.7),
     ):
         """
         Represents a comparison of the data in `col_name` with three or more levels:
@@ -213,9 +213,9 @@ class JaroAtThresholds(ComparisonCreator):
 
         Args:
             col_name (str): The name of the column to compare.
-            score_threshold_or_thresholds (Union[float, list], optional): The
+            score_threshold_or_thresholds (Union[float, Iterable[float]], optional): The
                 threshold(s) to use for the Jaro similarity level(s).
-                Defaults to [0.9, 0.7].
+                Defaults to (0.9, 0.7).
         """
 
         thresholds_as_iterable = ensure_is_iterable(score_threshold_or_thresholds)
@@ -241,7 +241,7 @@ class JaroWinklerAtThresholds(ComparisonCreator):
     def __init__(
         self,
         col_name: str,
-        score_threshold_or_thresholds: Union[Iterable[float], float] = [0.9, 0.7],
+        score_threshold_or_thresholds: Union[Iterable[float], float] = (0.9, 0.7),
     ):
         """
         Represents a comparison of the data in `col_name` with three or more levels:
@@ -260,9 +260,9 @@ class JaroWinklerAtThresholds(ComparisonCreator):
 
         Args:
             col_name (str): The name of the column to compare.
-            score_threshold_or_thresholds (Union[float, list], optional): The
+            score_threshold_or_thresholds (Union[float, Iterable[float]], optional): The
                 threshold(s) to use for the Jaro-Winkler similarity level(s).
-                Defaults to [0.9, 0.7].
+                Defaults to (0.9, 0.7).
         """
 
         thresholds_as_iterable = ensure_is_iterable(score_threshold_or_thresholds)
@@ -550,7 +550,7 @@ class ArrayIntersectAtSizes(ComparisonCreator):
     def __init__(
         self,
         col_name: str,
-        size_threshold_or_thresholds: Union[Iterable[int], int] = [1],
+        size_threshold_or_thresholds: Union[Iterable[int], int] = (1,),
     ):
         """
         Represents a comparison of the data in `col_name` with multiple levels based on
@@ -568,9 +568,9 @@ class ArrayIntersectAtSizes(ComparisonCreator):
 
         Args:
             col_name (str): The name of the column to compare.
-            size_threshold_or_thresholds (Union[int, list[int]], optional): The
+            size_threshold_or_thresholds (Union[int, Iterable[int]], optional): The
                 size threshold(s) for the intersection levels.
-                Defaults to [1].
+                Defaults to (1,).
         """
 
         thresholds_as_iterable = ensure_is_iterable(size_threshold_or_thresholds)
@@ -643,6 +643,9 @@ class DistanceInKMAtThresholds(ComparisonCreator):
 
 
 class CustomComparison(ComparisonCreator):
+    # the level creators belong to the caller, who may reconfigure them
+    _cache_levels = False
+
     def __init__(
         self,
         comparison_levels: List[Union[ComparisonLevelCreator, dict[str, Any]]],
@@ -713,12 +716,16 @@ class DateOfBirthComparison(ComparisonCreator):
         col_name: Union[str, ColumnExpression],
         *,
         input_is_string: bool,
-        datetime_thresholds: Union[int, float, List[Union[int, float]]] = [1, 1, 10],
-        datetime_metrics: Union[DateMetricType, List[DateMetricType]] = [
+        datetime_thresholds: Union[int, float, Iterable[Union[int, float]]] = (
+            1,
+            1,
+            10,
+        ),
+        datetime_metrics: Union[DateMetricType, Iterable[DateMetricType]] = (
             "month",
             "year",
             "year",
-        ],
+        ),
         datetime_format: str = None,
         invalid_dates_as_null: bool = True,
     ):
@@ -742,17 +749,17 @@ class DateOfBirthComparison(ComparisonCreator):
             col_name (Union[str, ColumnExpression]): The column name
             input_is_string (bool): If True, the provided `col_name` must be of type
                 string.  If False, it must be a date or datetime.
-            datetime_thresholds (Union[int, float, List[Union[int, float]]], optional):
-                Numeric thresholds for date differences. Defaults to [1, 1, 10].
-            datetime_metrics (Union[DateMetricType, List[DateMetricType]], optional):
-                Metrics for date differences. Defaults to ["month", "year", "year"].
+            datetime_thresholds (Union[int, float, Iterable[Union[int, float]]], optional):
+                Numeric thresholds for date differences. Defaults to (1, 1, 10).
+            datetime_metrics (Union[DateMetricType, Iterable[DateMetricType]], optional):
+                Metrics for date differences. Defaults to ("month", "year", "year").
             datetime_format (str, optional): The datetime format used to cast strings
                 to dates.  Only used if input is a string.
             invalid_dates_as_null (bool, optional): If True, treat invalid dates as null
                 as opposed to allowing e.g. an exact or levenshtein match where one side
                 or both are an invalid date.  Only used if input is a string.  Defaults
                 to True.
-        """
+        """  # noqa: E501
         date_thresholds_as_iterable = ensure_is_iterable(datetime_thresholds)
         self.datetime_thresholds = [*date_thresholds_as_iterable]
         date_metrics_as_iterable = ensure_is_iterable(datetime_metrics)
@@ -843,7 +850,7 @@ class PostcodeComparison(ComparisonCreator):
         invalid_postcodes_as_null: bool = False,
         lat_col: Union[str, ColumnExpression] = None,
         long_col: Union[str, ColumnExpression] = None,
-        km_thresholds: Union[float, List[float]] = [1, 10, 100],
+        km_thresholds: Union[float, Iterable[float]] = (1, 10, 100),
     ):
         """
         Generate an 'out of the box' comparison for a postcode column with the
@@ -875,9 +882,9 @@ class PostcodeComparison(ComparisonCreator):
                 expression for latitude. Required if `km_thresholds` is provided.
             long_col (Union[str, ColumnExpression], optional): The column name or
                 expression for longitude. Required if `km_thresholds` is provided.
-            km_thresholds (Union[float, List[float]], optional): Thresholds for distance
-                in kilometers. If provided, `lat_col` and `long_col` must also be
-                provided.
+            km_thresholds (Union[float, Iterable[float]], optional):
+                Thresholds for distance in kilometers. If provided, `lat_col` and
+                `long_col` must also be provided.
         """
         self.valid_postcode_regex = (
             self.VALID_POSTCODE_REGEX if invalid_postcodes_as_null else None
@@ -901,7 +908,7 @@ class PostcodeComparison(ComparisonCreator):
         district_col_expression = full_col_expression.regex_extract(self.DISTRICT_REGEX)
         area_col_expression = full_col_expression.regex_extract(self.AREA_REGEX)
 
-        levels: list[ComparisonLevelCreator] = []
+        levels: list[ComparisonLevelCreator]
 
         if len(self.km_thresholds) == 0:
             levels = [
@@ -921,7 +928,7 @@ class PostcodeComparison(ComparisonCreator):
                     label_for_charts="Exact match on area"
                 ),
             ]
-        if len(self.km_thresholds) > 0:
+        else:
             # Don't include the very high level postcode categories
             # if using km thresholds - they are better modelled as geo distances
             levels = [
@@ -1004,7 +1011,7 @@ class NameComparison(ComparisonCreator):
         self,
         col_name: Union[str, ColumnExpression],
         *,
-        jaro_winkler_thresholds: Union[float, list[float]] = [0.92, 0.88, 0.7],
+        jaro_winkler_thresholds: Union[float, Iterable[float]] = (0.92, 0.88, 0.7),
         dmeta_col_name: str = None,
     ):
         """
@@ -1028,8 +1035,9 @@ class NameComparison(ComparisonCreator):
         Args:
             col_name (Union[str, ColumnExpression]): The column name or expression for
                 the names to be compared.
-            jaro_winkler_thresholds (Union[float, list[float]], optional): Thresholds
-                for Jaro-Winkler similarity. Defaults to [0.92, 0.88, 0.7].
+            jaro_winkler_thresholds (Union[float, Iterable[float]], optional):
+                Thresholds for Jaro-Winkler similarity. Defaults to
+                (0.92, 0.88, 0.7).
             dmeta_col_name (str, optional): The column name for dmetaphone values.
                 If provided, array intersection level is included. This column must
                 contain arrays of dmetaphone values, which are of length 1 or 2.
@@ -1090,7 +1098,7 @@ class ForenameSurnameComparison(ComparisonCreator):
         forename_col_name: Union[str, ColumnExpression],
         surname_col_name: Union[str, ColumnExpression],
         *,
-        jaro_winkler_thresholds: Union[float, list[float]] = [0.92, 0.88],
+        jaro_winkler_thresholds: Union[float, Iterable[float]] = (0.92, 0.88),
         forename_surname_concat_col_name: str = None,
     ):
         """
@@ -1118,8 +1126,8 @@ class ForenameSurnameComparison(ComparisonCreator):
                 expression for the forenames to be compared.
             surname_col_name (Union[str, ColumnExpression]): The column name or
                 expression for the surnames to be compared.
-            jaro_winkler_thresholds (Union[float, list[float]], optional): Thresholds
-                for Jaro-Winkler similarity. Defaults to [0.92, 0.88].
+            jaro_winkler_thresholds (Union[float, Iterable[float]], optional):
+                Thresholds for Jaro-Winkler similarity. Defaults to (0.92, 0.88).
             forename_surname_concat_col_name (str, optional): The column name for
                 concatenated forename and surname values. If provided, term
                 frequencies are applied on the exact match using this column
@@ -1194,7 +1202,7 @@ class CosineSimilarityAtThresholds(ComparisonCreator):
     def __init__(
         self,
         col_name: str,
-        score_threshold_or_thresholds: Union[Iterable[float], float] = [0.9, 0.8, 0.7],
+        score_threshold_or_thresholds: Union[Iterable[float], float] = (0.9, 0.8, 0.7),
     ):
         """
         Represents a comparison of the data in `col_name` with two or more levels:
@@ -1211,9 +1219,9 @@ class CosineSimilarityAtThresholds(ComparisonCreator):
 
         Args:
             col_name (str): The name of the column to compare.
-            score_threshold_or_thresholds (Union[float, list], optional): The
+            score_threshold_or_thresholds (Union[float, Iterable[float]], optional): The
                 threshold(s) to use for the cosine similarity level(s).
-                Defaults to [0.9, 0.7].
+                Defaults to (0.9, 0.8, 0.7).
         """
 
         thresholds_as_iterable = ensure_is_iterable(score_threshold_or_thresholds)
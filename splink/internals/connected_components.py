@@ -22,7 +22,7 @@ from splink.internals.splink_dataframe import SplinkDataFrame
 logger = logging.getLogger(__name__)
 
 
-def _cc_generate_neighbours_representation() -> str:
+def _cc_generate_neighbours_representation() -> list[dict[str, str]]:
     """SQL to generate all the 'neighbours' of each input node.
 
     The 'neighbour' of a node is any other node that is connected to the original node
@@ -37,27 +37,48 @@ def _cc_generate_neighbours_representation() -> str:
     2. The table contains all nodes, even those with no edges (these are represented)
         as a 'self link' i.e. ID1 -> ID1, ensuring they are present in the final
         clusters table.
+
+    The edges are made symmetric first (each edge in both directions, with self
+    links kept only once), so that the nodes only need to be joined to them once.
     """
 
+    sqls = []
+
     sql = """
-    select n.node_id,
-        e_l.node_id_r as neighbour
-    from nodes_ids_only as n
+    select node_id_l, node_id_r
+    from __splink__df_edges_with_self_loops
+
+    UNION ALL
 
-    left join __splink__df_edges_with_self_loops as e_l
-        on n.node_id = e_l.node_id_l
+    select node_id_r as node_id_l, node_id_l as node_id_r
+    from __splink__df_edges_with_self_loops
+    where node_id_l <> node_id_r
+    """
 
-    UNION
+    sqls.append(
+        {
+            "sql": sql,
+            "output_table_name": "__splink__df_edges_symmetric",
+        }
+    )
 
+    sql = """
     select n.node_id,
-        coalesce(e_r.node_id_l, n.node_id) as neighbour
+        coalesce(e.node_id_r, n.node_id) as neighbour
     from nodes_ids_only as n
 
-    left join __splink__df_edges_with_self_loops as e_r
-        on n.node_id = e_r.node_id_r
+    left join __splink__df_edges_symmetric as e
+        on n.node_id = e.node_id_l
     """
 
-    return sql
+    sqls.append(
+        {
+            "sql": sql,
+            "output_table_name": "__splink__df_neighbours",
+        }
+    )
+
+    return sqls
 
 
 def _cc_generate_initial_representatives_table() -> str:
@@ -297,10 +318,11 @@ def _cc_find_converged_nodes(
     )
 
     sql_stable = f"""
-    SELECT *
-        FROM {representatives_name}
-        WHERE representative NOT IN (
-            SELECT representative FROM non_stable_representatives
+    SELECT r.*
+        FROM {representatives_name} AS r
+        WHERE NOT EXISTS (
+            SELECT 1 FROM non_stable_representatives AS ns
+            WHERE ns.representative = r.representative
         )
         """
     sqls.append(
@@ -347,19 +369,27 @@ def solve_connected_components(
 
     pipeline = CTEPipeline([edges_table, nodes_table])
 
-    match_prob_expr = f"where match_probability >= {threshold_match_probability}"
-    if threshold_match_probability is None:
-        match_prob_expr = ""
+    edge_l = edge_id_column_name_left
+    edge_r = edge_id_column_name_right
+
+    # Self links in the input are dropped here and added back for every node below
+    edge_filters = [f"{edge_l} <> {edge_r}"]
+    if threshold_match_probability is not None:
+        edge_filters.append(f"match_probability >= {threshold_match_probability}")
+    edge_filter_expr = " and ".join(edge_filters)
 
+    # Each edge is written with the lower id on the left so that duplicates
+    # (including a -> b alongside b -> a) are removed by the distinct, leaving
+    # the two halves of the union disjoint.
     # Add 'self-edges' so that the algorithm can 'see' the nodes with no edges
     sql = f"""
-    select
-        {edge_id_column_name_left} as node_id_l,
-        {edge_id_column_name_right} as node_id_r
+    select distinct
+        case when {edge_l} < {edge_r} then {edge_l} else {edge_r} end as node_id_l,
+        case when {edge_l} < {edge_r} then {edge_r} else {edge_l} end as node_id_r
     from {edges_table.templated_name}
-    {match_prob_expr}
+    where {edge_filter_expr}
 
-    UNION
+    UNION ALL
 
     select
     {node_id_column_name} as node_id_l,
@@ -375,8 +405,8 @@ def solve_connected_components(
 
     pipeline.enqueue_sql(sql, "nodes_ids_only")
 
-    sql = _cc_generate_neighbours_representation()
-    pipeline.enqueue_sql(sql, "__splink__df_neighbours")
+    sqls = _cc_generate_neighbours_representation()
+    pipeline.enqueue_list_of_sqls(sqls)
     neighbours = db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
     edges_with_self_loops.drop_table_from_database_and_remove_from_cache()
@@ -429,25 +459,15 @@ def solve_connected_components(
 
         converged_clusters_tables.append(representatives_stable)
 
-        # Remove stable clusters from representatives table
-        pipeline = CTEPipeline([representatives_stable, prev_representatives_table])
-        sql = f"""
-        SELECT *
-        FROM {prev_representatives_table.templated_name}
-        WHERE representative NOT IN (
-            SELECT representative FROM __splink__representatives_stable_{iteration}
-        )
-        """
-        pipeline.enqueue_sql(sql, f"__splink__representatives_unstable_{iteration}")
-        prev_representatives_thinned = db_api.sql_pipeline_to_splink_dataframe(pipeline)
-
-        # 1a. Thin neighbours table - we can drop all rows that refer to
+        # 1b. Thin neighbours table - we can drop all rows that refer to
         # node_ids that have converged
-        pipeline = CTEPipeline([prev_representatives_thinned, filtered_neighbours])
+        pipeline = CTEPipeline([representatives_stable, filtered_neighbours])
         sql = f"""
-        select * from {filtered_neighbours.templated_name}
-        where node_id in
-            (select node_id from {prev_representatives_thinned.templated_name})
+        select n.* from {filtered_neighbours.templated_name} as n
+        where not exists (
+            select 1 from {representatives_stable.templated_name} as s
+            where s.node_id = n.node_id
+        )
         """
         pipeline.enqueue_sql(sql, f"__splink__df_neighbours_filtered_{iteration}")
         filtered_neighbours_thinned = db_api.sql_pipeline_to_splink_dataframe(pipeline)
@@ -456,16 +476,28 @@ def solve_connected_components(
 
         # Generates our representatives table for the next iteration
         # by joining our previous tables onto our neighbours table.
-        pipeline = CTEPipeline([filtered_neighbours])
+        # The stable clusters are removed from the representatives table
+        # within the same pipeline, rather than materialising a thinned copy
+        pipeline = CTEPipeline(
+            [filtered_neighbours, representatives_stable, prev_representatives_table]
+        )
+        prev_representatives_thinned = f"__splink__representatives_unstable_{iteration}"
+        sql = f"""
+        SELECT r.*
+        FROM {prev_representatives_table.templated_name} AS r
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {representatives_stable.templated_name} AS s
+            WHERE s.representative = r.representative
+        )
+        """
+        pipeline.enqueue_sql(sql, prev_representatives_thinned)
         sql = _cc_generate_representatives_loop_cond(
-            prev_representatives_thinned.physical_name,
+            prev_representatives_thinned,
             filtered_neighbours.templated_name,
         )
         pipeline.enqueue_sql(sql, "r")
         # Update our needs_updating column in the representatives table.
-        sql = _cc_update_representatives_loop_cond(
-            prev_representatives_thinned.physical_name
-        )
+        sql = _cc_update_representatives_loop_cond(prev_representatives_thinned)
 
         repr_name = f"__splink__df_representatives_{iteration}"
 
@@ -476,10 +508,6 @@ def solve_connected_components(
 
         representatives = db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
-        # Now the new representatives have been computed from the thinned
-        # representatives we no longer need the older table
-        prev_representatives_thinned.drop_table_from_database_and_remove_from_cache()
-
         pipeline = CTEPipeline()
         # Update table reference
         prev_representatives_table.drop_table_from_database_and_remove_from_cache()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import multiprocessing
+import os
 from copy import deepcopy
 from typing import TYPE_CHECKING, List
 
@@ -9,10 +10,12 @@ from splink.internals.blocking import block_using_rules_sqls, blocking_rule_to_o
 from splink.internals.comparison_vector_values import (
     compute_comparison_vector_values_from_id_pairs_sqls,
 )
+from splink.internals.input_column import InputColumn
 from splink.internals.m_u_records_to_parameters import (
     append_u_probability_to_comparison_level_trained_probabilities,
     m_u_records_to_lookup_dict,
 )
+from splink.internals.misc import dedupe_preserving_order
 from splink.internals.pipeline import CTEPipeline
 from splink.internals.vertically_concatenate import (
     enqueue_df_concat,
@@ -21,15 +24,27 @@ from splink.internals.vertically_concatenate import (
 
 from .expectation_maximisation import (
     compute_new_parameters_sql,
-    compute_proportions_for_new_parameters,
+    compute_proportions_for_new_parameters_sql,
 )
 
 # https://stackoverflow.com/questions/39740632/python-type-hinting-without-cyclic-imports
 if TYPE_CHECKING:
     from splink.internals.linker import Linker
+    from splink.internals.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# CPUs this process may run on, which respects affinity masks (e.g. taskset
+# or container cpusets) where the platform exposes them
+if hasattr(os, "sched_getaffinity"):
+    _CPU_COUNT = len(os.sched_getaffinity(0))
+else:
+    _CPU_COUNT = multiprocessing.cpu_count()
+
+# Each salting partition adds a UNION ALL branch to the u estimation blocking
+# sql, so don't follow the parallelism of a large Spark cluster all the way up
+_MAX_SPARK_U_SALTING_PARTITIONS = 16
+
 
 def _rows_needed_for_n_pairs(n_pairs):
     # Number of pairs generated by cartesian product is
@@ -46,11 +61,13 @@ def _proportion_sample_size_link_only(
     # total valid links is sum of pairwise product of individual row counts
     # i.e. if frame_counts are [a, b, c, d, ...],
     # total_links = a*b + a*c + a*d + ... + b*c + b*d + ... + c*d + ...
-    total_links = (
-        sum(row_counts_individual_dfs) ** 2
-        - sum([count**2 for count in row_counts_individual_dfs])
-    ) / 2
-    total_nodes = sum(row_counts_individual_dfs)
+    # = ((a + b + c + ...)^2 - (a^2 + b^2 + c^2 + ...)) / 2
+    total_nodes = 0
+    sum_of_squares = 0
+    for count in row_counts_individual_dfs:
+        total_nodes += count
+        sum_of_squares += count * count
+    total_links = (total_nodes * total_nodes - sum_of_squares) / 2
 
     # if we scale each frame by a proportion total_links scales with the square
     # i.e. (our target) max_pairs == proportion^2 * total_links
@@ -60,6 +77,32 @@ def _proportion_sample_size_link_only(
     return proportion, sample_size
 
 
+def _salting_partitions_for_u_estimation(linker: Linker) -> int:
+    # The u estimation blocking rule is a cartesian product, so needs
+    # salting for the backend to spread the work across cores/executors
+    dialect = linker._sql_dialect_str
+    if dialect == "duckdb":
+        return _CPU_COUNT
+    if dialect == "spark":
+        spark = linker._db_api.spark  # type: ignore [attr-defined]
+        parallelism = spark.sparkContext.defaultParallelism
+        return min(parallelism, _MAX_SPARK_U_SALTING_PARTITIONS)
+    return 1
+
+
+def _columns_to_select_for_u_sample(settings_obj: Settings) -> list[str]:
+    # Blocking and the comparison vectors only read these columns from the
+    # sample, so there is no need to copy every input column into it
+    input_cols: list[InputColumn] = []
+    input_cols.extend(settings_obj.column_info_settings.unique_id_input_columns)
+    for cc in settings_obj.comparisons:
+        input_cols.extend(cc._input_columns_used_by_case_statement)
+    input_cols.extend(settings_obj._additional_columns_to_retain)
+
+    # e.g. arr[1] is read as l.arr[1], so the sample needs the whole of arr
+    return dedupe_preserving_order([c.unbracketed_name for c in input_cols])
+
+
 def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> None:
     logger.info("----- Estimating u probabilities using random sampling -----")
     pipeline = CTEPipeline()
@@ -123,42 +166,65 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
     pipeline = CTEPipeline()
     pipeline = enqueue_df_concat(training_linker, pipeline)
 
+    salting_partitions = _salting_partitions_for_u_estimation(linker)
+    salt_u_blocking = max_pairs > 1e4 and salting_partitions > 1
+
+    # __splink__df_concat only has a salt column if the original settings
+    # required one, so add it to the sample if not
+    add_salt_column = salt_u_blocking and not settings_obj.salting_required
+
+    sample_cols = _columns_to_select_for_u_sample(settings_obj)
+    if add_salt_column:
+        sample_cols.append("random() as __splink_salt")
+    elif salt_u_blocking:
+        sample_cols.append("__splink_salt")
+
     sql = f"""
-    select *
+    select {", ".join(sample_cols)}
     from __splink__df_concat
     {training_linker._random_sample_sql(proportion, sample_size, seed)}
     """
 
-    pipeline.enqueue_sql(sql, "__splink__df_concat_sample")
-    df_sample = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    # If every record is kept and __splink__df_concat is already materialised
+    # there is no need to write out a copy of it as the sample
+    sample_is_df_concat = (
+        proportion == 1.0 and not add_salt_column and not pipeline.queue
+    )
+
+    if sample_is_df_concat:
+        df_sample = pipeline.input_dataframes[0]
+        sample_tablename = "__splink__df_concat"
+    else:
+        pipeline.enqueue_sql(sql, "__splink__df_concat_sample")
+        df_sample = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+        sample_tablename = "__splink__df_concat_sample"
 
     pipeline = CTEPipeline(input_dataframes=[df_sample])
 
-    if linker._sql_dialect.sql_dialect_str == "duckdb" and max_pairs > 1e4:
+    if salt_u_blocking:
         br = blocking_rule_to_obj(
             {
                 "blocking_rule": "1=1",
-                "salting_partitions": multiprocessing.cpu_count(),
+                "salting_partitions": salting_partitions,
             }
         )
         settings_obj._blocking_rules_to_generate_predictions = [br]
     else:
         settings_obj._blocking_rules_to_generate_predictions = []
 
-    input_tablename_sample_l = "__splink__df_concat_sample"
-    input_tablename_sample_r = "__splink__df_concat_sample"
+    input_tablename_sample_l = sample_tablename
+    input_tablename_sample_r = sample_tablename
 
     if (
         len(linker._input_tables_dict) == 2
         and linker._settings_obj._link_type == "link_only"
     ):
         sqls = split_df_concat_with_tf_into_two_tables_sqls(
-            "__splink__df_concat",
+            sample_tablename,
             linker._settings_obj.column_info_settings.source_dataset_column_name,
-            sample_switch=True,
         )
-        input_tablename_sample_l = "__splink__df_concat_sample_left"
-        input_tablename_sample_r = "__splink__df_concat_sample_right"
+        input_tablename_sample_l = f"{sample_tablename}_left"
+        input_tablename_sample_r = f"{sample_tablename}_right"
 
         pipeline.enqueue_list_of_sqls(sqls)
 
@@ -178,8 +244,8 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
     sqls = compute_comparison_vector_values_from_id_pairs_sqls(
         settings_obj._columns_to_select_for_blocking,
         settings_obj._columns_to_select_for_comparison_vector_values,
-        input_tablename_l="__splink__df_concat_sample",
-        input_tablename_r="__splink__df_concat_sample",
+        input_tablename_l=sample_tablename,
+        input_tablename_r=sample_tablename,
         source_dataset_input_column=settings_obj.column_info_settings.source_dataset_input_column,
         unique_id_input_column=settings_obj.column_info_settings.unique_id_input_column,
     )
@@ -196,23 +262,23 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
     sql = compute_new_parameters_sql(
         estimate_without_term_frequencies=False,
         comparisons=settings_obj.comparisons,
+        include_probability_two_random_records_match=False,
     )
 
     pipeline.enqueue_sql(sql, "__splink__m_u_counts")
+
+    # The counts table is tiny, so normalise it in the same pipeline rather
+    # than round-tripping through pandas
+    sql = compute_proportions_for_new_parameters_sql("__splink__m_u_counts")
+    pipeline.enqueue_sql(sql, "__splink__m_u_proportions")
     df_params = db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
-    param_records = df_params.as_pandas_dataframe()
-    param_records = compute_proportions_for_new_parameters(param_records)
+    param_records = df_params.as_record_dict()
     df_params.drop_table_from_database_and_remove_from_cache()
-    df_sample.drop_table_from_database_and_remove_from_cache()
-
-    m_u_records = [
-        r
-        for r in param_records
-        if r["output_column_name"] != "_probability_two_random_records_match"
-    ]
+    if not sample_is_df_concat:
+        df_sample.drop_table_from_database_and_remove_from_cache()
 
-    m_u_records_lookup = m_u_records_to_lookup_dict(m_u_records)
+    m_u_records_lookup = m_u_records_to_lookup_dict(param_records)
 
     for c in original_settings_obj.comparisons:
         for cl in c._comparison_levels_excluding_null:
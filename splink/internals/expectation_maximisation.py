@@ -42,9 +42,16 @@ def count_agreement_patterns_sql(comparisons: List[Comparison]) -> str:
 
 
 def compute_new_parameters_sql(
-    estimate_without_term_frequencies: bool, comparisons: List[Comparison]
+    estimate_without_term_frequencies: bool,
+    comparisons: List[Comparison],
+    include_probability_two_random_records_match: bool = True,
 ) -> str:
-    """compute m and u counts from the results of predict"""
+    """compute m and u counts from the results of predict
+
+    When only the m or u values are needed (e.g. when estimating u by random
+    sampling), set `include_probability_two_random_records_match` to False to
+    skip the extra aggregation over the whole of __splink__df_predict
+    """
     if estimate_without_term_frequencies:
         agreement_pattern_count = "agreement_pattern_count"
     else:
@@ -68,6 +75,9 @@ def compute_new_parameters_sql(
         for cc in comparisons
     ]
 
+    if not include_probability_two_random_records_match:
+        return " union all ".join(union_sqls)
+
     # Probability of two random records matching
     sql = f"""
     select 0 as comparison_vector_value,
@@ -94,9 +104,9 @@ def compute_proportions_for_new_parameters_sql(table_name):
     select
         comparison_vector_value,
         output_column_name,
-        m_count/sum(m_count) over (PARTITION BY output_column_name)
+        m_count/nullif(sum(m_count) over (PARTITION BY output_column_name), 0)
             as m_probability,
-        u_count/sum(u_count) over (PARTITION BY output_column_name)
+        u_count/nullif(sum(u_count) over (PARTITION BY output_column_name), 0)
             as u_probability
     from {table_name}
     where comparison_vector_value != -1
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from copy import copy
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Type
 
 import sqlglot
@@ -76,7 +77,7 @@ class SqlglotColumnTreeBuilder:
 
     @property
     def sql(self) -> str:
-        return self.as_sqlglot_tree.sql(dialect=self.sqlglot_dialect)
+        return _column_tree_builder_sql(self)
 
     @classmethod
     def from_raw_column_name_or_column_reference(cls, input_str, sqlglot_dialect):
@@ -234,6 +235,11 @@ class InputColumn:
     def name(self) -> str:
         return self.col_builder.sql
 
+    @property
+    def unbracketed_name(self) -> str:
+        # e.g. "arr" for arr[1], or "m" for m['key']
+        return replace(self.col_builder, bracket_index=None, bracket_key=None).sql
+
     @property
     def name_l(self) -> str:
         new_column_name = self.col_builder.column_name + "_l"
@@ -312,6 +318,14 @@ class InputColumn:
         return f"{self.__class__.__name__}\n({self.col_builder.__repr__()}\n)"
 
 
+@lru_cache(maxsize=1024)
+def _column_tree_builder_sql(col_builder: SqlglotColumnTreeBuilder) -> str:
+    # The builder is frozen, so the sql it generates can be cached.  InputColumn
+    # creates a new builder for each derived name (name_l, tf_name etc.) so
+    # caching on the value rather than the instance means these get reused
+    return col_builder.as_sqlglot_tree.sql(dialect=col_builder.sqlglot_dialect)
+
+
 def _get_dialect_quotes(dialect):
     """
     Returns the appropriate quotation marks for identifiers based on the SQL dialect.
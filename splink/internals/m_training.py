@@ -76,6 +76,7 @@ def estimate_m_values_from_label_column(linker: "Linker", label_colname: str) ->
     sql = compute_new_parameters_sql(
         estimate_without_term_frequencies=False,
         comparisons=settings_obj.comparisons,
+        include_probability_two_random_records_match=False,
     )
     pipeline.enqueue_sql(sql, "__splink__m_u_counts")
 
@@ -84,12 +85,7 @@ def estimate_m_values_from_label_column(linker: "Linker", label_colname: str) ->
     param_records = df_params.as_pandas_dataframe()
     param_records = compute_proportions_for_new_parameters(param_records)
 
-    m_u_records = [
-        r
-        for r in param_records
-        if r["output_column_name"] != "_probability_two_random_records_match"
-    ]
-    m_u_records_lookup = m_u_records_to_lookup_dict(m_u_records)
+    m_u_records_lookup = m_u_records_to_lookup_dict(param_records)
     for cc in original_settings_object.comparisons:
         for cl in cc._comparison_levels_excluding_null:
             append_m_probability_to_comparison_level_trained_probabilities(
@@ -211,7 +211,7 @@ def concat_table_column_names(linker: Linker) -> list[str]:
 
 
 def split_df_concat_with_tf_into_two_tables_sqls(
-    input_tablename: str, source_dataset_col: str, sample_switch: bool = False
+    input_tablename: str, source_dataset_col: str
 ) -> list[dict[str, str]]:
     # For the two dataset link only, rather than a self join of
     # __splink__df_concat_with_tf, it's much faster to split the input
@@ -220,30 +220,29 @@ def split_df_concat_with_tf_into_two_tables_sqls(
     # see https://github.com/moj-analytical-services/splink/pull/1359
 
     sqls = []
-    sample_text = "_sample" if sample_switch else ""
 
     sql = f"""
-        select * from {input_tablename}{sample_text}
+        select * from {input_tablename}
         where {source_dataset_col} =
-            (select min({source_dataset_col}) from {input_tablename}{sample_text})
+            (select min({source_dataset_col}) from {input_tablename})
         """
 
     sqls.append(
         {
             "sql": sql,
-            "output_table_name": f"{input_tablename}{sample_text}_left",
+            "output_table_name": f"{input_tablename}_left",
         }
     )
 
     sql = f"""
-        select * from {input_tablename}{sample_text}
+        select * from {input_tablename}
         where {source_dataset_col} =
-            (select max({source_dataset_col}) from {input_tablename}{sample_text})
+            (select max({source_dataset_col}) from {input_tablename})
         """
     sqls.append(
         {
             "sql": sql,
-            "output_table_name": f"{input_tablename}{sample_text}_right",
+            "output_table_name": f"{input_tablename}_right",
         }
     )
     return sqls
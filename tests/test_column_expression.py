@@ -88,3 +88,19 @@ def test_nullif(test_helpers, dialect):
         res["cleaned_name"],
         pd.Series(["name_1", None, None, "name_4", None], name="cleaned_name"),
     )
+
+
+def test_column_expression_follows_dialect_changes():
+    col = ColumnExpression("first name")
+    lowered = col.lower()
+
+    col.sql_dialect = SplinkDialect.from_string("duckdb")
+    assert col.name_l == '"first name_l"'
+
+    col.sql_dialect = SplinkDialect.from_string("spark")
+    assert col.name_l == "`first name_l`"
+    lowered.sql_dialect = SplinkDialect.from_string("spark")
+    assert lowered.name_r == "LOWER(`first name_r`)"
+
+    col.sql_dialect = SplinkDialect.from_string("duckdb")
+    assert col.name_r == '"first name_r"'
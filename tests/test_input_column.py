@@ -1,9 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError, dataclass, replace
 from functools import partial
 
 import pytest
 
-from splink.internals.input_column import InputColumn, _get_dialect_quotes
+from splink.internals.input_column import (
+    InputColumn,
+    SqlglotColumnTreeBuilder,
+    _get_dialect_quotes,
+)
 
 
 @dataclass
@@ -74,6 +78,11 @@ def test_input_column():
     assert c.l_tf_name_as_l == l_tf_name_as_l
 
     assert c.unquote().name == "col['lat']"
+    assert c.unbracketed_name == '"col"'
+
+    c = InputColumn("col[1]", sqlglot_dialect_str="duckdb")
+    assert c.name == '"col"[1]'
+    assert c.unbracketed_name == '"col"'
 
     c = InputColumn("first name", sqlglot_dialect_str="spark")
     assert c.name == "`first name`"
@@ -170,6 +179,41 @@ def test_input_column_without_expressions(dialect):
             )
 
 
+def test_column_tree_builder_sql_is_cached_by_value():
+    # the generated sql is cached on the builder's value, so builders that
+    # differ only in dialect or bracket must not share a cached result
+    builder = SqlglotColumnTreeBuilder(
+        column_name="first name",
+        table=None,
+        quoted=True,
+        bracket_index=None,
+        bracket_key=None,
+        sqlglot_dialect="duckdb",
+        alias=None,
+    )
+    with pytest.raises(FrozenInstanceError):
+        builder.sqlglot_dialect = "spark"
+
+    variants = {
+        '"first name"': builder,
+        "`first name`": replace(builder, sqlglot_dialect="spark"),
+        '"first name"[1]': replace(builder, bracket_index=0),
+        "\"first name\"['lat']": replace(builder, bracket_key="lat"),
+        "`first name`['lat']": replace(
+            builder, sqlglot_dialect="spark", bracket_key="lat"
+        ),
+    }
+    for expected_sql, variant in variants.items():
+        # an equal builder built separately hits the cache with the same result
+        equal_variant = replace(variant)
+        assert equal_variant == variant
+        assert hash(equal_variant) == hash(variant)
+        assert variant.sql == expected_sql
+        assert equal_variant.sql == expected_sql
+        uncached_sql = variant.as_sqlglot_tree.sql(dialect=variant.sqlglot_dialect)
+        assert variant.sql == uncached_sql
+
+
 def test_illegal_names_error():
     # Check some odd, but legal names all run without issue
     odd_but_legal_names = (
@@ -381,6 +381,16 @@ def test_cl_configure():
         # too few probabilities
         cl.LevenshteinAtThresholds("col", [1, 2]).configure(u_probabilities=[0.5, 0.5])
 
+    # a configuration that is rejected should leave the comparison unchanged
+    comparison = cl.ExactMatch("col").configure(m_probabilities=[0.8, 0.2])
+    with pytest.raises(ValueError):
+        comparison.configure(
+            term_frequency_adjustments=True, u_probabilities=[0.5, 0.3, 0.2]
+        )
+    assert comparison.m_probabilities == (0.8, 0.2)
+    assert comparison.u_probabilities is None
+    assert not comparison.term_frequency_adjustments
+
 
 def test_comparison_reconfigure():
     def assert_tf_adjustments_on_off(
@@ -435,13 +445,77 @@ def test_comparison_level_reconfigure():
 def test_sequential_configurations():
     # want to check that configurations don't forget about previously-set options
     em_with_m = cl.ExactMatch("col").configure(m_probabilities=[0.8, 0.2])
-    assert em_with_m.m_probabilities == [0.8, 0.2]
+    assert em_with_m.m_probabilities == (0.8, 0.2)
     assert not em_with_m.term_frequency_adjustments
 
     em_with_m.configure(term_frequency_adjustments=True)
     assert em_with_m.term_frequency_adjustments
-    assert em_with_m.m_probabilities == [0.8, 0.2]
+    assert em_with_m.m_probabilities == (0.8, 0.2)
 
     em_with_m.configure(m_probabilities=[0.9, 0.1])
-    assert em_with_m.m_probabilities == [0.9, 0.1]
+    assert em_with_m.m_probabilities == (0.9, 0.1)
     assert em_with_m.term_frequency_adjustments
+
+
+def test_get_comparison_after_reconfigure():
+    comparison_creator = cl.ExactMatch("col").configure(m_probabilities=[0.8, 0.2])
+
+    comparison = comparison_creator.get_comparison("duckdb")
+    # each call should give us a comparison that can be trained independently
+    assert comparison is not comparison_creator.get_comparison("duckdb")
+    assert comparison.comparison_levels[1].m_probability == 0.8
+
+    comparison_creator.configure(m_probabilities=[0.9, 0.1])
+    comparison = comparison_creator.get_comparison("duckdb")
+    assert comparison.comparison_levels[1].m_probability == 0.9
+
+
+def test_get_comparison_after_setting_term_frequency_adjustments():
+    comparison_creator = cl.ExactMatch("name")
+    comparison = comparison_creator.get_comparison("duckdb")
+    assert comparison.comparison_levels[1]._tf_adjustment_column is None
+
+    comparison_creator.term_frequency_adjustments = True
+    comparison = comparison_creator.get_comparison("duckdb")
+    tf_col = comparison.comparison_levels[1]._tf_adjustment_input_column
+    assert tf_col.unquote().name == "name"
+
+
+def test_custom_comparison_follows_reconfigured_levels():
+    exact_match_level = cll.ExactMatchLevel("name").configure(m_probability=0.95)
+    comparison_creator = cl.CustomComparison(
+        comparison_levels=[
+            cll.NullLevel("name"),
+            exact_match_level,
+            cll.ElseLevel(),
+        ],
+        output_column_name="name",
+    )
+    comparison = comparison_creator.get_comparison("duckdb")
+    assert comparison.comparison_levels[1].m_probability == 0.95
+
+    # the level creator belongs to the caller, so changes to it must be seen
+    exact_match_level.configure(m_probability=0.77)
+    comparison = comparison_creator.get_comparison("duckdb")
+    assert comparison.comparison_levels[1].m_probability == 0.77
+
+
+def test_custom_comparison_follows_reconfigured_null_levels():
+    jaro_winkler_level = cll.JaroWinklerLevel("name", 0.9)
+    comparison_creator = cl.CustomComparison(
+        comparison_levels=[
+            cll.NullLevel("name"),
+            cll.ExactMatchLevel("name"),
+            jaro_winkler_level,
+            cll.ElseLevel(),
+        ],
+        output_column_name="name",
+    )
+    comparison_creator.configure(m_probabilities=[0.7, 0.2, 0.1])
+    assert comparison_creator.num_non_null_levels == 3
+
+    # the level creator belongs to the caller, so the level counts must follow it
+    jaro_winkler_level.configure(is_null_level=True)
+    assert comparison_creator.num_non_null_levels == 2
+    comparison_creator.configure(m_probabilities=[0.9, 0.1])
+    assert comparison_creator.m_probabilities == (0.9, 0.1)
@@ -4,9 +4,14 @@ import pandas as pd
 import pytest
 
 import splink.internals.comparison_library as cl
-from splink.internals.estimate_u import _proportion_sample_size_link_only
+import splink.internals.estimate_u as estimate_u
+from splink.internals.estimate_u import (
+    _proportion_sample_size_link_only,
+    _salting_partitions_for_u_estimation,
+)
 from splink.internals.pipeline import CTEPipeline
-from tests.decorator import mark_with_dialects_excluding
+from splink.internals.vertically_concatenate import compute_df_concat_with_tf
+from tests.decorator import mark_with_dialects_excluding, mark_with_dialects_including
 
 
 @mark_with_dialects_excluding()
@@ -46,6 +51,159 @@ def test_u_train(test_helpers, dialect):
     assert br.blocking_rule_sql == "l.name = r.name"
 
 
+@mark_with_dialects_excluding()
+def test_u_train_with_cached_df_concat(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    data = [
+        {"unique_id": 1, "name": "Amanda"},
+        {"unique_id": 2, "name": "Robin"},
+        {"unique_id": 3, "name": "Robyn"},
+        {"unique_id": 4, "name": "David"},
+        {"unique_id": 5, "name": "Eve"},
+        {"unique_id": 6, "name": "Amanda"},
+    ]
+    df = pd.DataFrame(data)
+
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [cl.LevenshteinAtThresholds("name", 2)],
+        "blocking_rules_to_generate_predictions": ["l.name = r.name"],
+    }
+    df_linker = helper.convert_frame(df)
+
+    linker = helper.Linker(df_linker, settings, **helper.extra_linker_args())
+    df_concat_with_tf = compute_df_concat_with_tf(linker, CTEPipeline())
+
+    # max_pairs exceeds the number of possible pairs, so the cached table
+    # is used as the sample and must survive training
+    linker.training.estimate_u_using_random_sampling(max_pairs=1e6)
+    cc_name = linker._settings_obj.comparisons[0]
+
+    denom = (6 * 5) / 2  # n(n-1) / 2
+    cl_exact = cc_name._get_comparison_level_by_comparison_vector_value(2)
+    assert cl_exact.u_probability == 1 / denom
+    cl_no = cc_name._get_comparison_level_by_comparison_vector_value(0)
+    assert cl_no.u_probability == (denom - 2) / denom
+
+    assert "__splink__df_concat_with_tf" in linker._intermediate_table_cache
+    assert len(df_concat_with_tf.as_record_dict()) == 6
+
+
+@mark_with_dialects_including("duckdb", pass_dialect=True)
+def test_u_train_with_bracketed_columns(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    # the u sample only projects the columns comparisons use, which must be
+    # the whole array or map column rather than the indexed value
+    df = pd.DataFrame(
+        {
+            "unique_id": [1, 2, 3, 4],
+            "arr": [[1, 2], [1, 3], [2, 2], [1, 2]],
+            "m": [{"k": "a"}, {"k": "a"}, {"k": "b"}, {"k": "c"}],
+            "not_used": ["w", "x", "y", "z"],
+        }
+    )
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [cl.ExactMatch("arr[1]"), cl.ExactMatch("m['k']")],
+    }
+    df_linker = helper.convert_frame(df)
+    linker = helper.Linker(df_linker, settings, **helper.extra_linker_args())
+    linker.training.estimate_u_using_random_sampling(max_pairs=1e6)
+
+    cc_arr, cc_map = linker._settings_obj.comparisons
+    denom = (4 * 3) / 2  # n(n-1) / 2
+    cl_exact = cc_arr._get_comparison_level_by_comparison_vector_value(1)
+    assert cl_exact.u_probability == 3 / denom
+    cl_exact = cc_map._get_comparison_level_by_comparison_vector_value(1)
+    assert cl_exact.u_probability == 1 / denom
+
+
+def _u_train_recording_salting(helper, monkeypatch):
+    data = [
+        {"unique_id": 1, "name": "Amanda"},
+        {"unique_id": 2, "name": "Robin"},
+        {"unique_id": 3, "name": "Robyn"},
+        {"unique_id": 4, "name": "David"},
+        {"unique_id": 5, "name": "Eve"},
+        {"unique_id": 6, "name": "Amanda"},
+    ]
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [cl.LevenshteinAtThresholds("name", 2)],
+        "blocking_rules_to_generate_predictions": ["l.name = r.name"],
+    }
+    df_linker = helper.convert_frame(pd.DataFrame(data))
+    linker = helper.Linker(df_linker, settings, **helper.extra_linker_args())
+
+    salting_partitions_used = []
+    blocking_rule_to_obj = estimate_u.blocking_rule_to_obj
+
+    def recording_blocking_rule_to_obj(br):
+        salting_partitions_used.append(br["salting_partitions"])
+        return blocking_rule_to_obj(br)
+
+    monkeypatch.setattr(
+        estimate_u, "blocking_rule_to_obj", recording_blocking_rule_to_obj
+    )
+
+    # max_pairs exceeds the number of possible pairs, so the u values are exact
+    linker.training.estimate_u_using_random_sampling(max_pairs=1e6)
+
+    cc_name = linker._settings_obj.comparisons[0]
+    u_probabilities = [
+        cc_name._get_comparison_level_by_comparison_vector_value(i).u_probability
+        for i in (2, 1, 0)
+    ]
+    denom = (6 * 5) / 2  # n(n-1) / 2
+    assert u_probabilities == [1 / denom, 1 / denom, (denom - 2) / denom]
+
+    return _salting_partitions_for_u_estimation(linker), salting_partitions_used
+
+
+@pytest.mark.parametrize("cpu_count", [1, 64])
+@mark_with_dialects_including("duckdb", pass_dialect=True)
+def test_u_train_salting_follows_cpu_count(
+    test_helpers, dialect, cpu_count, monkeypatch
+):
+    # on a single core there is nothing to gain from salting, and
+    # SaltedBlockingRule requires more than one partition
+    monkeypatch.setattr(estimate_u, "_CPU_COUNT", cpu_count)
+    partitions, salting_partitions_used = _u_train_recording_salting(
+        test_helpers[dialect], monkeypatch
+    )
+
+    assert partitions == cpu_count
+    assert salting_partitions_used == ([] if cpu_count == 1 else [cpu_count])
+
+
+@pytest.mark.parametrize(
+    "parallelism, expected_partitions",
+    [(1, 1), (1000, estimate_u._MAX_SPARK_U_SALTING_PARTITIONS)],
+)
+@mark_with_dialects_including("spark", pass_dialect=True)
+def test_u_train_salting_follows_spark_parallelism(
+    test_helpers, dialect, parallelism, expected_partitions, monkeypatch
+):
+    helper = test_helpers[dialect]
+    monkeypatch.setattr(
+        type(helper.spark.sparkContext),
+        "defaultParallelism",
+        property(lambda self: parallelism),
+    )
+
+    # the concat has no salt column, as the settings don't need salting,
+    # so when salted the sample has to add its own
+    partitions, salting_partitions_used = _u_train_recording_salting(
+        helper, monkeypatch
+    )
+
+    assert partitions == expected_partitions
+    if expected_partitions == 1:
+        assert salting_partitions_used == []
+    else:
+        assert salting_partitions_used == [expected_partitions]
+
+
 @mark_with_dialects_excluding()
 def test_u_train_link_only(test_helpers, dialect):
     helper = test_helpers[dialect]